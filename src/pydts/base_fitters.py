@@ -2,8 +2,12 @@ from typing import Iterable, Tuple, Union
 
 import pandas as pd
 import numpy as np
-from .utils import get_expanded_df
+from .utils import get_expanded_df, get_expanded_df_numpy
 
+EXPANSION_ENGINES = {
+    'pandas': get_expanded_df,
+    'numpy': get_expanded_df_numpy,
+}
 
 
 class BaseFitter:
@@ -70,7 +74,8 @@ class ExpansionBasedFitter(BaseFitter):
                      df: pd.DataFrame,
                      event_type_col: str,
                      duration_col: str,
-                     pid_col: str) -> pd.DataFrame:
+                     pid_col: str,
+                     engine: str = 'pandas') -> pd.DataFrame:
         """
         This method expands the raw data as explained in Lee et al. 2018
 
@@ -80,12 +85,18 @@ class ExpansionBasedFitter(BaseFitter):
                                   Right censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
             duration_col (str): Last follow up time column name (must be a column in df).
             pid_col (str): Sample ID column name (must be a column in df).
+            engine (str, Optional): Expansion engine, one of 'pandas' (pydts.utils.get_expanded_df) or
+                                    'numpy' (pydts.utils.get_expanded_df_numpy). Both return the same expanded
+                                    dataframe, the 'numpy' engine is faster and requires less memory on large data.
 
         Returns:
             Expanded df (pandas.DataFrame): the expanded dataframe.
         """
         self._validate_cols(df, event_type_col, duration_col, pid_col)
-        return get_expanded_df(df=df, event_type_col=event_type_col, duration_col=duration_col, pid_col=pid_col)
+        if engine not in EXPANSION_ENGINES:
+            raise ValueError(f"Unknown expansion engine {engine}, must be one of {list(EXPANSION_ENGINES.keys())}")
+        return EXPANSION_ENGINES[engine](df=df, event_type_col=event_type_col, duration_col=duration_col,
+                                         pid_col=pid_col)
 
     def predict_hazard_jt(self, df: pd.DataFrame, event: Union[str, int], t: Union[Iterable, int]) -> pd.DataFrame:
         """
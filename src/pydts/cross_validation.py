@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from .fitters import TwoStagesFitter, TwoStagesFitterExact
+from .expanded_data import ExpandedData
 import warnings
 from copy import deepcopy
 from sklearn.model_selection import KFold
@@ -33,7 +34,7 @@ class BaseTwoStagesCV(object):
         self.TwoStagesFitter_type = 'CoxPHFitter'
 
     def cross_validate(self,
-                       full_df: pd.DataFrame,
+                       full_df: Union[pd.DataFrame, ExpandedData],
                        n_splits: int = 5,
                        shuffle: bool = True,
                        seed: Union[int, None] = None,
@@ -50,7 +51,8 @@ class BaseTwoStagesCV(object):
         """
         This method implements K-fold cross-validation using TwoStagesFitters and full_df data.
         Args:
-            full_df (pd.DataFrame): Data to cross validate.
+            full_df (Union[pd.DataFrame, ExpandedData]): Data to cross validate.
+                                                         For an ExpandedData object (see pydts.expanded_data.ExpandedData) the folds are split by samples.
             n_splits (int): Number of folds, defaults to 5.
             shuffle (boolean): Shuffle samples before splitting to folds. Defaults to True.
             seed: Pseudo-random seed to KFold instance. Defaults to None.
@@ -82,14 +84,11 @@ class BaseTwoStagesCV(object):
         self.models = {}
         self.kfold_cv = KFold(n_splits=n_splits, shuffle=shuffle, random_state=seed)
 
-        if 'C' in full_df.columns:
-            full_df = full_df.drop(['C'], axis=1)
-        if 'T' in full_df.columns:
-            full_df = full_df.drop(['T'], axis=1)
+        full_df, samples_df = _get_samples_df(full_df)
 
-        for i_fold, (train_index, test_index) in enumerate(self.kfold_cv.split(full_df)):
-            self.test_pids[i_fold] = full_df.iloc[test_index][pid_col].values
-            train_df, test_df = full_df.iloc[train_index], full_df.iloc[test_index]
+        for i_fold, (train_index, test_index) in enumerate(self.kfold_cv.split(samples_df)):
+            self.test_pids[i_fold] = samples_df.iloc[test_index][pid_col].values
+            train_df, test_df = _get_fold_train_df(full_df, train_index), samples_df.iloc[test_index]
             if self.TwoStagesFitter_type == 'Exact':
                 fold_fitter = TwoStagesFitterExact()
             else:
@@ -154,7 +153,7 @@ class BasePenaltyGridSearchCV(object):
         self.TwoStagesFitter_type = 'CoxPHFitter'
 
     def cross_validate(self,
-                       full_df: pd.DataFrame,
+                       full_df: Union[pd.DataFrame, ExpandedData],
                        l1_ratio: float,
                        penalizers: list,
                        n_splits: int = 5,
@@ -170,7 +169,8 @@ class BasePenaltyGridSearchCV(object):
         This method implements K-fold cross-validation using PenaltyGridSearch and full_df data.
 
         Args:
-            full_df (pd.DataFrame): Data to cross validate.
+            full_df (Union[pd.DataFrame, ExpandedData]): Data to cross validate.
+                                                         For an ExpandedData object (see pydts.expanded_data.ExpandedData) the folds are split by samples.
             l1_ratio (float): regularization ratio for the CoxPHFitter (see lifelines.fitters.coxph_fitter.CoxPHFitter documentation).
             penalizers (list): penalizer options for each event (see lifelines.fitters.coxph_fitter.CoxPHFitter documentation).
             n_splits (int): Number of folds, defaults to 5.
@@ -197,16 +197,13 @@ class BasePenaltyGridSearchCV(object):
         self.folds_grids = {}
         self.kfold_cv = KFold(n_splits=n_splits, shuffle=shuffle, random_state=seed)
 
-        if 'C' in full_df.columns:
-            full_df = full_df.drop(['C'], axis=1)
-        if 'T' in full_df.columns:
-            full_df = full_df.drop(['T'], axis=1)
+        full_df, samples_df = _get_samples_df(full_df)
 
-        for i_fold, (train_index, test_index) in enumerate(self.kfold_cv.split(full_df)):
+        for i_fold, (train_index, test_index) in enumerate(self.kfold_cv.split(samples_df)):
             print(f'Starting fold {i_fold+1}/{n_splits}')
             start = time()
-            self.test_pids[i_fold] = full_df.iloc[test_index][pid_col].values
-            train_df, test_df = full_df.iloc[train_index], full_df.iloc[test_index]
+            self.test_pids[i_fold] = samples_df.iloc[test_index][pid_col].values
+            train_df, test_df = _get_fold_train_df(full_df, train_index), samples_df.iloc[test_index]
             if self.TwoStagesFitter_type == 'Exact':
                 fold_pgs = PenaltyGridSearchExact()
             else:
@@ -248,6 +245,23 @@ class BasePenaltyGridSearchCV(object):
         return gauc_output_df
 
 
+def _get_samples_df(full_df):
+    # Returns the data to split and the samples (unexpanded) data to evaluate on
+    if isinstance(full_df, ExpandedData):
+        return full_df, full_df.get_samples_df()
+    if 'C' in full_df.columns:
+        full_df = full_df.drop(['C'], axis=1)
+    if 'T' in full_df.columns:
+        full_df = full_df.drop(['T'], axis=1)
+    return full_df, full_df
+
+
+def _get_fold_train_df(full_df, train_index):
+    if isinstance(full_df, ExpandedData):
+        return full_df.take(train_index)
+    return full_df.iloc[train_index]
+
+
 class PenaltyGridSearchCV(BasePenaltyGridSearchCV):
 
     def __init__(self):
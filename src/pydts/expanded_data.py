@@ -0,0 +1,383 @@
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class ExpandedData(object):
+    """
+    This class holds the expanded discrete-time data (see pydts.utils.get_expanded_df) as contiguous typed arrays
+    instead of a wide pandas DataFrame:
+
+    - pids: the samples ids, one entry per sample.
+    - offsets: row offsets index, the rows of sample i are offsets[i]:offsets[i+1].
+    - event_types: the observed event type of each sample (0 for right-censored samples).
+    - times: int16/int32 time value of each expanded row.
+    - event_indicators: int8 matrix of the j_* indicators, one column per entry of event_columns.
+    - covariates_values: 2-D (column-major) block of the covariates values of each expanded row.
+
+    The fitters, screening and cross-validation classes accept an ExpandedData object wherever expanded data is
+    expected, so large expanded datasets can be kept in memory at a fraction of the size of the expanded dataframe.
+
+    Example:
+        ```py linenums="1"
+            from pydts.expanded_data import ExpandedData
+            from pydts.fitters import TwoStagesFitter
+            expanded_data = ExpandedData.from_df(df=train_df, event_type_col='J', duration_col='X', pid_col='pid')
+            fitter = TwoStagesFitter()
+            fitter.fit(df=expanded_data)
+        ```
+    """
+
+    def __init__(self,
+                 pids: np.ndarray,
+                 offsets: np.ndarray,
+                 event_types: np.ndarray,
+                 times: np.ndarray,
+                 covariates_values: np.ndarray,
+                 covariates: List[str],
+                 event_type_col: str = 'J',
+                 duration_col: str = 'X',
+                 pid_col: str = 'pid',
+                 event_indicators: Optional[np.ndarray] = None,
+                 event_columns: Optional[List[str]] = None,
+                 base_columns: Optional[List[str]] = None):
+        self.pids = pids
+        self.offsets = offsets.astype(np.int64, copy=False)
+        self.event_types = event_types
+        self.times = times
+        self.covariates_values = covariates_values
+        self.covariates = list(covariates)
+        self.event_type_col = event_type_col
+        self.duration_col = duration_col
+        self.pid_col = pid_col
+        self.events = [e for e in sorted(np.unique(event_types)) if e != 0]
+        if event_columns is None:
+            _events = [0] + self.events if (event_types == 0).any() else self.events + [0]
+            event_columns = [f'j_{e}' for e in _events]
+        self.event_columns = list(event_columns)
+        if event_indicators is None:
+            event_indicators = self._get_event_indicators()
+        self.event_indicators = event_indicators
+        if base_columns is None:
+            base_columns = [pid_col] + self.covariates + [event_type_col, duration_col]
+        self.base_columns = list(base_columns)
+
+    @classmethod
+    def from_df(cls,
+                df: pd.DataFrame,
+                event_type_col: str = 'J',
+                duration_col: str = 'X',
+                pid_col: str = 'pid',
+                covariates: Optional[List[str]] = None,
+                dtype: type = np.float64) -> 'ExpandedData':
+        """
+        This method expands the raw data (one row per sample) directly into an ExpandedData object, without building
+        the expanded dataframe.
+
+        Args:
+            df (pd.DataFrame): Dataframe to expand.
+            event_type_col (str): The event type column name (must be a column in df),
+                                  Right censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
+            duration_col (str): Last follow up time column name (must be a column in df).
+            pid_col (str): Sample ID column name (must be a column in df).
+            covariates (list, Optional): A list of covariates, all must be columns in df.
+                                         Defaults to all the columns of df except event_type_col, duration_col, and pid_col.
+            dtype (type, Optional): The dtype of the covariates block. Defaults to numpy.float64.
+
+        Returns:
+            expanded_data (ExpandedData): the expanded data.
+        """
+        _validate_cols(df, event_type_col, duration_col, pid_col)
+        if covariates is None:
+            covariates = [col for col in df if col not in [event_type_col, duration_col, pid_col]]
+        cov_not_in_df = [cov for cov in covariates if cov not in df.columns]
+        if len(cov_not_in_df) > 0:
+            raise ValueError(f"Missing covariates from df: {cov_not_in_df}")
+
+        durations = _to_time_codes(df[duration_col].values)
+        unique_times = np.unique(durations)
+        counts = np.searchsorted(unique_times, durations, side='right')
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        n_rows = int(offsets[-1])
+        times_idx = np.arange(n_rows)
+        times_idx -= np.repeat(offsets[:-1], counts)
+        rows_idx = np.repeat(np.arange(len(df)), counts)
+
+        covariates_values = np.empty((n_rows, len(covariates)), dtype=dtype, order='F')
+        for idx, cov in enumerate(covariates):
+            covariates_values[:, idx] = df[cov].values[rows_idx]
+
+        return cls(pids=df[pid_col].values.copy(),
+                   offsets=offsets,
+                   event_types=_to_small_int(df[event_type_col].values),
+                   times=unique_times[times_idx],
+                   covariates_values=covariates_values,
+                   covariates=covariates,
+                   event_type_col=event_type_col,
+                   duration_col=duration_col,
+                   pid_col=pid_col,
+                   base_columns=[c for c in df.columns if c in ([pid_col, event_type_col, duration_col] + covariates)])
+
+    @classmethod
+    def from_expanded_df(cls,
+                         expanded_df: pd.DataFrame,
+                         event_type_col: str = 'J',
+                         duration_col: str = 'X',
+                         pid_col: str = 'pid',
+                         covariates: Optional[List[str]] = None,
+                         dtype: type = np.float64) -> 'ExpandedData':
+        """
+        This method converts an expanded dataframe, in the format produced by pydts.utils.get_expanded_df(),
+        to an ExpandedData object. The rows of each sample are expected to be consecutive and ordered by time.
+
+        Args:
+            expanded_df (pd.DataFrame): expanded dataframe.
+            event_type_col (str): The event type column name (must be a column in expanded_df).
+            duration_col (str): Time column name (must be a column in expanded_df).
+            pid_col (str): Sample ID column name (must be a column in expanded_df).
+            covariates (list, Optional): A list of covariates, all must be columns in expanded_df.
+                                         Defaults to all the columns of expanded_df except event_type_col, duration_col, pid_col and the j_* columns.
+            dtype (type, Optional): The dtype of the covariates block. Defaults to numpy.float64.
+
+        Returns:
+            expanded_data (ExpandedData): the expanded data.
+        """
+        _validate_cols(expanded_df, event_type_col, duration_col, pid_col)
+        event_columns = [c for c in expanded_df.columns if str(c).startswith('j_')]
+        if covariates is None:
+            covariates = [col for col in expanded_df
+                          if col not in ([event_type_col, duration_col, pid_col] + event_columns)]
+
+        pids = expanded_df[pid_col].values
+        starts = np.flatnonzero(np.concatenate([[True], pids[1:] != pids[:-1]]))
+        offsets = np.concatenate([starts, [len(expanded_df)]]).astype(np.int64)
+        last_rows = offsets[1:] - 1
+
+        covariates_values = np.empty((len(expanded_df), len(covariates)), dtype=dtype, order='F')
+        for idx, cov in enumerate(covariates):
+            covariates_values[:, idx] = expanded_df[cov].values
+
+        return cls(pids=pids[starts].copy(),
+                   offsets=offsets,
+                   event_types=_to_small_int(expanded_df[event_type_col].values[last_rows]),
+                   times=_to_time_codes(expanded_df[duration_col].values),
+                   covariates_values=covariates_values,
+                   covariates=covariates,
+                   event_type_col=event_type_col,
+                   duration_col=duration_col,
+                   pid_col=pid_col,
+                   event_indicators=np.asfortranarray(expanded_df[event_columns].values.astype(np.int8)),
+                   event_columns=event_columns,
+                   base_columns=[c for c in expanded_df.columns
+                                 if c in ([pid_col, event_type_col, duration_col] + covariates)])
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.pids)
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self.times[self.offsets[1:] - 1]
+
+    @property
+    def columns(self) -> List[str]:
+        return self.base_columns + self.event_columns
+
+    @property
+    def nbytes(self) -> int:
+        return int(sum(a.nbytes for a in [self.pids, self.offsets, self.event_types, self.times,
+                                          self.event_indicators, self.covariates_values]))
+
+    def get_column(self, col: str) -> np.ndarray:
+        """
+        This method returns the values of a single column of the expanded data.
+
+        Args:
+            col (str): column name, one of ExpandedData.columns.
+
+        Returns:
+            values (np.ndarray): the column values, one entry per expanded row.
+        """
+        if col == self.pid_col:
+            return np.repeat(self.pids, self.counts)
+        elif col == self.event_type_col:
+            return np.repeat(self.event_types, self.counts)
+        elif col == self.duration_col:
+            return self.times
+        elif col in self.event_columns:
+            return self.event_indicators[:, self.event_columns.index(col)]
+        elif col in self.covariates:
+            return self.covariates_values[:, self.covariates.index(col)]
+        raise KeyError(col)
+
+    def __getitem__(self, col: str) -> pd.Series:
+        return pd.Series(self.get_column(col), name=col)
+
+    def get_covariates_values(self, covariates: Optional[List[str]] = None) -> np.ndarray:
+        """
+        This method returns the covariates block of the requested covariates. A view is returned whenever possible.
+
+        Args:
+            covariates (list, Optional): covariates names. Defaults to all the covariates.
+
+        Returns:
+            values (np.ndarray): 2-D covariates block, one row per expanded row.
+        """
+        if covariates is None or list(covariates) == self.covariates:
+            return self.covariates_values
+        idx = np.array([self.covariates.index(cov) for cov in covariates], dtype=np.int64)
+        if len(idx) > 0 and np.all(np.diff(idx) == 1):
+            return self.covariates_values[:, idx[0]:idx[-1] + 1]
+        return np.asfortranarray(self.covariates_values[:, idx])
+
+    def to_df(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        This method converts the expanded data to an expanded dataframe in the format of pydts.utils.get_expanded_df().
+
+        Args:
+            columns (list, Optional): columns to include. Defaults to all the columns.
+
+        Returns:
+            expanded_df (pd.DataFrame): expanded dataframe.
+        """
+        columns = self.columns if columns is None else columns
+        data = {}
+        for col in columns:
+            values = self.get_column(col)
+            if col in self.event_columns:
+                values = values.astype(np.float64)
+            elif col in [self.duration_col, self.event_type_col]:
+                values = values.astype(np.int64)
+            data[col] = values
+        return pd.DataFrame(data, columns=columns)
+
+    def get_samples_df(self) -> pd.DataFrame:
+        """
+        This method returns the original (unexpanded) data, one row per sample, with the covariates values of the last
+        row of each sample.
+
+        Returns:
+            df (pd.DataFrame): samples dataframe.
+        """
+        last_rows = self.offsets[1:] - 1
+        data = {}
+        for col in self.base_columns:
+            if col == self.pid_col:
+                data[col] = self.pids
+            elif col == self.event_type_col:
+                data[col] = self.event_types.astype(np.int64)
+            elif col == self.duration_col:
+                data[col] = self.durations.astype(np.int64)
+            else:
+                data[col] = self.covariates_values[last_rows, self.covariates.index(col)]
+        return pd.DataFrame(data, columns=self.base_columns)
+
+    def select(self, covariates: List[str]) -> 'ExpandedData':
+        """
+        This method returns an ExpandedData object with a subset of the covariates. All other arrays are shared.
+
+        Args:
+            covariates (list): covariates names.
+
+        Returns:
+            expanded_data (ExpandedData): the expanded data with the requested covariates only.
+        """
+        cov_not_in_data = [cov for cov in covariates if cov not in self.covariates]
+        if len(cov_not_in_data) > 0:
+            raise ValueError(f"Missing covariates from the expanded data: {cov_not_in_data}")
+        return ExpandedData(pids=self.pids, offsets=self.offsets, event_types=self.event_types, times=self.times,
+                            covariates_values=self.get_covariates_values(covariates), covariates=covariates,
+                            event_type_col=self.event_type_col, duration_col=self.duration_col,
+                            pid_col=self.pid_col, event_indicators=self.event_indicators,
+                            event_columns=self.event_columns,
+                            base_columns=[c for c in self.base_columns
+                                          if c in ([self.pid_col, self.event_type_col, self.duration_col] +
+                                                   list(covariates))])
+
+    def take(self, samples_idx: Iterable) -> 'ExpandedData':
+        """
+        This method returns an ExpandedData object with the rows of the requested samples. As in the expansion of the
+        raw data, rows of times which are not observed in the requested samples are dropped.
+
+        Args:
+            samples_idx (Iterable): positional indices of the samples (not their ids).
+
+        Returns:
+            expanded_data (ExpandedData): the expanded data of the requested samples.
+        """
+        samples_idx = np.asarray(samples_idx, dtype=np.int64)
+        counts = self.counts[samples_idx]
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        rows_idx = np.arange(offsets[-1])
+        rows_idx += np.repeat(self.offsets[:-1][samples_idx] - offsets[:-1], counts)
+
+        # drop times that didn't happen
+        keep = np.isin(self.times[rows_idx], np.unique(self.durations[samples_idx]))
+        if not keep.all():
+            counts = np.add.reduceat(keep.astype(np.int64), offsets[:-1]) if len(counts) > 0 else counts
+            offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+            rows_idx = rows_idx[keep]
+
+        return ExpandedData(pids=self.pids[samples_idx], offsets=offsets,
+                            event_types=self.event_types[samples_idx], times=self.times[rows_idx],
+                            covariates_values=_take_rows(self.covariates_values, rows_idx),
+                            covariates=self.covariates, event_type_col=self.event_type_col,
+                            duration_col=self.duration_col, pid_col=self.pid_col,
+                            event_indicators=_take_rows(self.event_indicators, rows_idx),
+                            event_columns=self.event_columns, base_columns=self.base_columns)
+
+    def _get_event_indicators(self) -> np.ndarray:
+        event_indicators = np.zeros((len(self.times), len(self.event_columns)), dtype=np.int8, order='F')
+        last_rows = self.offsets[1:] - 1
+        event_indicators[:, self.event_columns.index('j_0')] = 1
+        for e in self.events:
+            event_rows = last_rows[self.event_types == e]
+            event_indicators[event_rows, self.event_columns.index(f'j_{e}')] = 1
+            event_indicators[event_rows, self.event_columns.index('j_0')] = 0
+        return event_indicators
+
+    def __repr__(self) -> str:
+        return f'ExpandedData(n_samples={self.n_samples}, n_rows={len(self)}, covariates={len(self.covariates)}, ' \
+               f'events={self.events}, nbytes={self.nbytes})'
+
+
+def _validate_cols(df, event_type_col, duration_col, pid_col):
+    assert event_type_col in df.columns, f'Event type column is missing from df: {event_type_col}'
+    assert duration_col in df.columns, f'Duration column is missing from df: {duration_col}'
+    assert pid_col in df.columns, f'Observation ID column is missing from df: {pid_col}'
+
+
+def _to_small_int(values: np.ndarray) -> np.ndarray:
+    # Casts integer values to the smallest integer dtype of int8/int16/int32 that holds them
+    if not np.issubdtype(values.dtype, np.integer):
+        if not np.all(np.mod(values, 1) == 0):
+            return values
+    for dtype in [np.int8, np.int16, np.int32]:
+        if (len(values) == 0) or ((values.min() >= np.iinfo(dtype).min) and (values.max() <= np.iinfo(dtype).max)):
+            return values.astype(dtype)
+    return values.astype(np.int64)
+
+
+def _to_time_codes(values: np.ndarray) -> np.ndarray:
+    # Discrete times are stored as int16 (or int32 when required)
+    if not np.issubdtype(values.dtype, np.integer) and not np.all(np.mod(values, 1) == 0):
+        raise ValueError('Discrete times must be integers')
+    if (len(values) == 0) or (values.max() <= np.iinfo(np.int16).max and values.min() >= np.iinfo(np.int16).min):
+        return values.astype(np.int16)
+    return values.astype(np.int32)
+
+
+def _take_rows(block: np.ndarray, rows_idx: np.ndarray) -> np.ndarray:
+    # Row selection which keeps the column-major layout of the block
+    result = np.empty((len(rows_idx), block.shape[1]), dtype=block.dtype, order='F')
+    for idx in range(block.shape[1]):
+        result[:, idx] = block[rows_idx, idx]
+    return result
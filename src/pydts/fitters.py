@@ -5,6 +5,7 @@ import statsmodels.api as sm
 from statsmodels.discrete.conditional_models import ConditionalLogit, ConditionalResultsWrapper
 from statsmodels.base.elastic_net import RegularizedResultsWrapper
 from .base_fitters import ExpansionBasedFitter
+from .expanded_data import ExpandedData
 from scipy.optimize import minimize
 from scipy.special import logit, expit
 import numpy as np
@@ -46,21 +47,23 @@ class DataExpansionFitter(ExpansionBasedFitter):
         super().__init__()
         self.models_kwargs = dict(family=sm.families.Binomial())
 
-    def _fit_event(self, model_fit_kwargs={}):
+    def _fit_event(self, model_fit_kwargs={}, expanded_df=None):
         """
         This method fits a model for a GLM model for a specific event.
 
         Args:
             model_fit_kwargs (dict, Optional): Keyword arguments to pass to model.fit() method.
+            expanded_df (pd.DataFrame, Optional): Expanded data to fit the model to. Defaults to self.expanded_df.
 
         Returns:
             fitted GLM model
         """
-        model = sm.GLM.from_formula(formula=self.formula, data=self.expanded_df, **self.models_kwargs)
+        expanded_df = self.expanded_df if expanded_df is None else expanded_df
+        model = sm.GLM.from_formula(formula=self.formula, data=expanded_df, **self.models_kwargs)
         return model.fit(**model_fit_kwargs)
 
     def fit(self,
-            df: pd.DataFrame,
+            df: Union[pd.DataFrame, ExpandedData],
             event_type_col: str = 'J',
             duration_col: str = 'X',
             pid_col: str = 'pid',
@@ -68,12 +71,14 @@ class DataExpansionFitter(ExpansionBasedFitter):
             covariates: Optional[list] = None,
             formula: Optional[str] = None,
             models_kwargs: Optional[dict] = None,
-            model_fit_kwargs: Optional[dict] = {}) -> dict:
+            model_fit_kwargs: Optional[dict] = {},
+            expansion_engine: str = 'pandas') -> dict:
         """
         This method fits a model to the discrete data.
 
         Args:
-            df (pd.DataFrame): training data for fitting the model
+            df (Union[pd.DataFrame, ExpandedData]): training data for fitting the model.
+                                                    An ExpandedData object (see pydts.expanded_data.ExpandedData) is treated as already expanded data.
             event_type_col (str): The event type column name (must be a column in df),
                                   Right censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
             duration_col (str): Last follow up time column name (must be a column in df).
@@ -85,6 +90,8 @@ class DataExpansionFitter(ExpansionBasedFitter):
             formula (str, Optional): Model formula to be fitted. Patsy format string.
             models_kwargs (dict, Optional): Keyword arguments to pass to model instance initiation.
             model_fit_kwargs (dict, Optional): Keyword arguments to pass to model.fit() method.
+            expansion_engine (str, Optional): The data expansion engine, 'pandas' or 'numpy' (faster and requires less memory).
+                                              See ExpansionBasedFitter._expand_data().
 
         Returns:
             event_models (dict): Fitted models dictionary. Keys - event names, Values - fitted models for the event.
@@ -104,24 +111,32 @@ class DataExpansionFitter(ExpansionBasedFitter):
             if len(cov_not_in_df) > 0:
                 raise ValueError(f"Error during fit - missing covariates from df: {cov_not_in_df}")
 
-        self.events = [c for c in sorted(df[event_type_col].unique()) if c != 0]
-        self.covariates = [col for col in df if col not in [event_type_col, duration_col, pid_col]] \
-                          if covariates is None else covariates
-        self.times = sorted(df[duration_col].unique())
-
-        if not skip_expansion:
-            self.expanded_df = self._expand_data(df=df, event_type_col=event_type_col, duration_col=duration_col,
-                                                 pid_col=pid_col)
-        else:
-            print('Skipping data expansion step, only use this option if the provided dataframe (df) is already correctly expanded.')
+        if isinstance(df, ExpandedData):
+            self.events = df.events
+            self.covariates = df.covariates if covariates is None else covariates
+            self.times = sorted(np.unique(df.durations.astype(np.int64)))
             self.expanded_df = df
+            expanded_df = df.to_df(columns=df.base_columns + [f'j_{event}' for event in self.events])
+        else:
+            self.events = [c for c in sorted(df[event_type_col].unique()) if c != 0]
+            self.covariates = [col for col in df if col not in [event_type_col, duration_col, pid_col]] \
+                              if covariates is None else covariates
+            self.times = sorted(df[duration_col].unique())
+
+            if not skip_expansion:
+                self.expanded_df = self._expand_data(df=df, event_type_col=event_type_col, duration_col=duration_col,
+                                                     pid_col=pid_col, engine=expansion_engine)
+            else:
+                print('Skipping data expansion step, only use this option if the provided dataframe (df) is already correctly expanded.')
+                self.expanded_df = df
+            expanded_df = self.expanded_df
 
         for event in self.events:
             cov = ' + '.join(self.covariates)
             _formula = f'j_{event} ~ {formula}' if formula is not None else \
                 f'j_{event} ~ {cov} + C({duration_col}) -1 '
             self.formula = _formula
-            self.event_models[event] = self._fit_event(model_fit_kwargs=model_fit_kwargs)
+            self.event_models[event] = self._fit_event(model_fit_kwargs=model_fit_kwargs, expanded_df=expanded_df)
         return self.event_models
 
     def print_summary(self,
@@ -253,6 +268,9 @@ class TwoStagesFitter(ExpansionBasedFitter):
 
     def _fit_event_beta(self, expanded_df, event, model=CoxPHFitter, model_kwargs={}, model_fit_kwargs={}):
         # Model fitting for conditional estimation of Beta_j for specific event
+        if isinstance(expanded_df, ExpandedData):
+            _covs = self.covariates[event] if isinstance(self.covariates, dict) else self.covariates
+            expanded_df = expanded_df.to_df(columns=_covs + [f'j_{event}', self.duration_col])
         if isinstance(self.covariates, list):
             strata_df = expanded_df[self.covariates + [f'j_{event}', self.duration_col]].copy()
         elif isinstance(self.covariates, dict):
@@ -286,7 +304,7 @@ class TwoStagesFitter(ExpansionBasedFitter):
         return beta_models
 
     def fit(self,
-            df: pd.DataFrame,
+            df: Union[pd.DataFrame, ExpandedData],
             covariates: Union[list, dict] = None,
             event_type_col: str = 'J',
             duration_col: str = 'X',
@@ -295,12 +313,14 @@ class TwoStagesFitter(ExpansionBasedFitter):
             x0: Union[np.array, int] = 0,
             fit_beta_kwargs: dict = {},
             verbose: int = 2,
-            nb_workers: int = WORKERS) -> dict:
+            nb_workers: int = WORKERS,
+            expansion_engine: str = 'pandas') -> dict:
         """
         This method fits a model to the discrete data.
 
         Args:
-            df (pd.DataFrame): training data for fitting the model
+            df (Union[pd.DataFrame, ExpandedData]): training data for fitting the model.
+                                                    An ExpandedData object (see pydts.expanded_data.ExpandedData) is treated as already expanded data.
             covariates (list): list of covariates to be used in estimating the regression coefficients
             event_type_col (str): The event type column name (must be a column in df),
                                   Right-censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
@@ -319,6 +339,8 @@ class TwoStagesFitter(ExpansionBasedFitter):
                                               }
             verbose (int, Optional): The verbosity level of pandaallel
             nb_workers (int, Optional): The number of workers to pandaallel. If not sepcified, defaults to the number of workers available.
+            expansion_engine (str, Optional): The data expansion engine, 'pandas' or 'numpy' (faster and requires less memory).
+                                              See ExpansionBasedFitter._expand_data().
         Returns:
             event_models (dict): Fitted models dictionary. Keys - event names, Values - fitted models for the event.
 
@@ -326,6 +348,10 @@ class TwoStagesFitter(ExpansionBasedFitter):
             [1] Meir, Tomer and Gorfine, Malka, "Discrete-time Competing-Risks Regression with or without Penalization", https://arxiv.org/abs/2303.01186
         """
 
+        expanded_df = None
+        if isinstance(df, ExpandedData):
+            expanded_df, df = df, df.get_samples_df()
+
         self._validate_cols(df, event_type_col, duration_col, pid_col)
         self.events = [c for c in sorted(df[event_type_col].unique()) if c != 0]
         if (covariates is not None):
@@ -348,9 +374,11 @@ class TwoStagesFitter(ExpansionBasedFitter):
         self.pid_col = pid_col
         self.times = sorted(df[duration_col].unique())
 
-        if not skip_expansion:
+        if expanded_df is not None:
+            pass
+        elif not skip_expansion:
             expanded_df = self._expand_data(df=df, event_type_col=event_type_col, duration_col=duration_col,
-                                                 pid_col=pid_col)
+                                            pid_col=pid_col, engine=expansion_engine)
         else:
             print('Skipping data expansion step, only use this option if the provided dataframe (df) is already correctly expanded.')
             expanded_df = df
@@ -764,10 +792,16 @@ class TwoStagesFitterExact(TwoStagesFitter):
         else:
             _covs = self.covariates
 
-        beta_j_model = ConditionalLogit(endog=expanded_df[f'j_{event}'],
-                                        exog=expanded_df[_covs],
-                                        groups=expanded_df[self.duration_col],
-                                        **model_kwargs)
+        if isinstance(expanded_df, ExpandedData):
+            beta_j_model = ConditionalLogit(endog=expanded_df.get_column(f'j_{event}').astype(np.float64),
+                                            exog=pd.DataFrame(expanded_df.get_covariates_values(_covs), columns=_covs),
+                                            groups=expanded_df.times,
+                                            **model_kwargs)
+        else:
+            beta_j_model = ConditionalLogit(endog=expanded_df[f'j_{event}'],
+                                            exog=expanded_df[_covs],
+                                            groups=expanded_df[self.duration_col],
+                                            **model_kwargs)
 
         if ('alpha' in model_fit_kwargs.keys()):
             # Use 0 <= L1_wt <= 1 parameter to switch between L2 (L1_wt = 0) and L1 (L1_wt = 1) or elastic net.
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from itertools import product
 from .fitters import TwoStagesFitter, TwoStagesFitterExact
+from .expanded_data import ExpandedData
 import warnings
 from copy import deepcopy
 pd.set_option("display.max_rows", 500)
@@ -30,7 +31,7 @@ class BasePenaltyGridSearch(object):
         self.TwoStagesFitter_type = 'CoxPHFitter'
 
     def evaluate(self,
-                 train_df: pd.DataFrame,
+                 train_df: Union[pd.DataFrame, ExpandedData],
                  test_df: pd.DataFrame,
                  l1_ratio: float,
                  penalizers: list,
@@ -45,7 +46,7 @@ class BasePenaltyGridSearch(object):
         This function implements model estimation using train_df and evaluation of the metrics using test_df to all the possible combinations of penalizers.
 
         Args:
-            train_df (pd.DataFrame): training data for fitting the model.
+            train_df (Union[pd.DataFrame, ExpandedData]): training data for fitting the model.
             test_df (pd.DataFrame): testing data for evaluating the estimated model's performance.
             l1_ratio (float): regularization ratio for the CoxPHFitter (see lifelines.fitters.coxph_fitter.CoxPHFitter documentation).
             penalizers (list): penalizer options for each event (see lifelines.fitters.coxph_fitter.CoxPHFitter documentation).
@@ -87,7 +88,10 @@ class BasePenaltyGridSearch(object):
             end = time()
             print(f"Finished estimating the coefficients for penalizer {penalizer} ({idp+1}/{len(penalizers)}), {int(end - start)} seconds")
 
-        events = [j for j in sorted(train_df[event_type_col].unique()) if j != 0]
+        if isinstance(train_df, ExpandedData):
+            events = train_df.events
+        else:
+            events = [j for j in sorted(train_df[event_type_col].unique()) if j != 0]
         grid = [penalizers for e in events]
         penalizers_combinations = list(product(*grid))
 
@@ -4,6 +4,7 @@ import numpy as np
 from typing import Optional, List, Union
 import psutil
 from .utils import get_expanded_df
+from .expanded_data import ExpandedData
 from joblib import Parallel, delayed
 
 
@@ -13,7 +14,7 @@ WORKERS = psutil.cpu_count(logical=False)
 class MarginalTwoStagesFitter(TwoStagesFitter):
 
     def fit(self,
-            expanded_df: pd.DataFrame,
+            expanded_df: Union[pd.DataFrame, ExpandedData],
             covariates: List = None,
             event_type_col: str = 'J',
             duration_col: str = 'X',
@@ -27,7 +28,7 @@ class MarginalTwoStagesFitter(TwoStagesFitter):
         Note that the expanded discrete-time data is expected as an input (see the Methods section of PyDTS documentation and pydts.utils.get_expanded_df).
 
         Args:
-            expanded_df (pd.DataFrame): expanded training data for fitting the model
+            expanded_df (Union[pd.DataFrame, ExpandedData]): expanded training data for fitting the model
             covariates (list): list of covariates to be used in estimating the regression coefficients
             event_type_col (str): The event type column name (must be a column in df),
                                   Right-censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
@@ -49,15 +50,20 @@ class MarginalTwoStagesFitter(TwoStagesFitter):
         """
 
         self._validate_cols(expanded_df, event_type_col, duration_col, pid_col)
-        self.events = [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
-
-        if covariates is None:
-            covariates = [col for col in expanded_df if col not in [event_type_col, duration_col, pid_col]]
+        if isinstance(expanded_df, ExpandedData):
+            self.events = expanded_df.events
+            if covariates is None:
+                covariates = expanded_df.covariates
+            self.times = sorted(np.unique(expanded_df.durations.astype(np.int64)))
+        else:
+            self.events = [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
+            if covariates is None:
+                covariates = [col for col in expanded_df if col not in [event_type_col, duration_col, pid_col]]
+            self.times = sorted(expanded_df[duration_col].unique())
         self.covariates = covariates
         self.event_type_col = event_type_col
         self.duration_col = duration_col
         self.pid_col = pid_col
-        self.times = sorted(expanded_df[duration_col].unique())
 
         self.expanded_df = expanded_df
 
@@ -69,7 +75,7 @@ class MarginalTwoStagesFitter(TwoStagesFitter):
 class MarginalTwoStagesFitterExact(TwoStagesFitterExact):
 
     def fit(self,
-            expanded_df: pd.DataFrame,
+            expanded_df: Union[pd.DataFrame, ExpandedData],
             covariates: List = None,
             event_type_col: str = 'J',
             duration_col: str = 'X',
@@ -83,7 +89,7 @@ class MarginalTwoStagesFitterExact(TwoStagesFitterExact):
         Note that the expanded discrete-time data is expected as an input (see the Methods section of PyDTS documentation and pydts.utils.get_expanded_df).
 
         Args:
-            expanded_df (pd.DataFrame): expanded training data for fitting the model
+            expanded_df (Union[pd.DataFrame, ExpandedData]): expanded training data for fitting the model
             covariates (list): list of covariates to be used in estimating the regression coefficients
             event_type_col (str): The event type column name (must be a column in df),
                                   Right-censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
@@ -105,15 +111,20 @@ class MarginalTwoStagesFitterExact(TwoStagesFitterExact):
         """
 
         self._validate_cols(expanded_df, event_type_col, duration_col, pid_col)
-        self.events = [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
-
-        if covariates is None:
-            covariates = [col for col in expanded_df if col not in [event_type_col, duration_col, pid_col]]
+        if isinstance(expanded_df, ExpandedData):
+            self.events = expanded_df.events
+            if covariates is None:
+                covariates = expanded_df.covariates
+            self.times = sorted(np.unique(expanded_df.durations.astype(np.int64)))
+        else:
+            self.events = [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
+            if covariates is None:
+                covariates = [col for col in expanded_df if col not in [event_type_col, duration_col, pid_col]]
+            self.times = sorted(expanded_df[duration_col].unique())
         self.covariates = covariates
         self.event_type_col = event_type_col
         self.duration_col = duration_col
         self.pid_col = pid_col
-        self.times = sorted(expanded_df[duration_col].unique())
 
         self.expanded_df = expanded_df
 
@@ -162,7 +173,7 @@ class BaseSISTwoStages(object):
         Note that the expanded discrete-time data is expected as an input (see the Methods section of PyDTS documentation and pydts.utils.get_expanded_df).
 
         Args:
-            expanded_df (pd.DataFrame): expanded training data for fitting the model
+            expanded_df (Union[pd.DataFrame, ExpandedData]): expanded training data for fitting the model
             covariate (str): a single covariate to be used in estimating the regression coefficients
             event_type_col (str): The event type column name (must be a column in df),
                                   Right-censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
@@ -184,16 +195,21 @@ class BaseSISTwoStages(object):
         """
 
         if self.events is None:
-            self.events = [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
+            self.events = _get_events(expanded_df, event_type_col)
 
         if self.TwoStagesFitter_type == 'Exact':
             marginal_model = MarginalTwoStagesFitterExact()
         else:
             marginal_model = MarginalTwoStagesFitter()
 
+        if isinstance(expanded_df, ExpandedData):
+            marginal_expanded_df = expanded_df.select([covariate])
+        else:
+            marginal_expanded_df = expanded_df[[pid_col, covariate, event_type_col, duration_col, 'j_0'] +
+                                               [f'j_{e}' for e in self.events]]
+
         marginal_model.fit(
-            expanded_df=expanded_df[[pid_col, covariate, event_type_col, duration_col, 'j_0'] +
-                                    [f'j_{e}' for e in self.events]],
+            expanded_df=marginal_expanded_df,
             covariates=[covariate],
             event_type_col=event_type_col,
             duration_col=duration_col,
@@ -223,7 +239,7 @@ class BaseSISTwoStages(object):
         Note that the expanded discrete-time data is expected as an input (see the Methods section of PyDTS documentation and pydts.utils.get_expanded_df).
 
         Args:
-            expanded_df (pd.DataFrame): expanded training data for fitting the model
+            expanded_df (Union[pd.DataFrame, ExpandedData]): expanded training data for fitting the model
             covariates (list): list of covariates to estimate the marginal regression coefficient for.
             event_type_col (str): The event type column name (must be a column in df),
                                   Right-censored sample (i) is indicated by event value 0, df.loc[i, event_type_col] = 0.
@@ -245,9 +261,11 @@ class BaseSISTwoStages(object):
         """
 
         if self.events is None:
-            self.events = [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
+            self.events = _get_events(expanded_df, event_type_col)
 
-        if covariates is None:
+        if covariates is None and isinstance(expanded_df, ExpandedData):
+            covariates = expanded_df.covariates
+        elif covariates is None:
             covariates = [col for col in expanded_df if col not in ([event_type_col, duration_col, pid_col, 'j_0'] +
                           [f'j_{e}' for e in self.events])]
 
@@ -493,6 +511,12 @@ class BaseSISTwoStages(object):
         return _params_cols
 
 
+def _get_events(expanded_df, event_type_col):
+    if isinstance(expanded_df, ExpandedData):
+        return expanded_df.events
+    return [c for c in sorted(expanded_df[event_type_col].unique()) if c != 0]
+
+
 class SISTwoStagesFitter(BaseSISTwoStages):
 
     def __init__(self):
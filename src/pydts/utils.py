@@ -37,6 +37,55 @@ def get_expanded_df(df, event_type_col='J', duration_col='X', pid_col='pid'):
     return result_df
 
 
+def get_expanded_df_numpy(df, event_type_col='J', duration_col='X', pid_col='pid'):
+    """
+    This function returns the same expanded dataframe as get_expanded_df() using array operations.
+    The number of rows of each sample is computed from the sorted unique times, all the rows are gathered with a single
+    take, and the j_* indicators are set directly on the last row of each sample, so no groupby, drop or dummies
+    passes over the expanded data are needed.
+    Right censoring is allowed and must be marked as event type 0.
+
+    :param df: original dataframe (pd.DataFrame)
+    :param event_type_col: event type column name (str)
+    :param duration_col: time column name (str)
+    :param pid_col: patient id column name (str)
+
+    :return: result_df: expanded dataframe
+    """
+    durations = df[duration_col].values
+    unique_times = np.unique(durations)
+    # number of observed times up to (and including) the last follow up time of each sample
+    counts = np.searchsorted(unique_times, durations, side='right')
+    ends = np.cumsum(counts)
+    n_rows = int(ends[-1]) if len(ends) > 0 else 0
+    times_idx = np.arange(n_rows)
+    times_idx -= np.repeat(ends - counts, counts)
+
+    result_df = df.drop(columns=[duration_col]).take(np.repeat(np.arange(len(df)), counts))
+    result_df.index = pd.RangeIndex(n_rows)
+    result_df.insert(df.columns.get_loc(duration_col), duration_col, unique_times.astype(np.int64)[times_idx])
+    del times_idx
+
+    events = sorted(df[event_type_col].unique())
+    event_types = df[event_type_col].values
+    last_rows = ends - 1
+    for e in events:
+        if e != 0:
+            result_df[f'j_{e}'] = _get_indicator(n_rows, last_rows[event_types == e], value=1.)
+        else:
+            result_df[f'j_{e}'] = _get_indicator(n_rows, last_rows[event_types > 0], value=0.)
+    if 0 not in events:
+        result_df[f'j_0'] = _get_indicator(n_rows, last_rows[event_types > 0], value=0.)
+    return result_df
+
+
+def _get_indicator(n_rows, rows, value):
+    # Returns a float column of length n_rows which equals value at rows and 1 - value elsewhere
+    indicator = np.full(n_rows, 1. - value)
+    indicator[rows] = value
+    return indicator
+
+
 def compare_models_coef_per_event(first_model: pd.Series,
                                   second_model: pd.Series,
                                   real_values: np.array,
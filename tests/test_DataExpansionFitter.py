@@ -54,6 +54,12 @@ class TestDataExpansionFitter(unittest.TestCase):
         m = DataExpansionFitter()
         m.fit(df=self.df.drop(['C', 'T'], axis=1))
 
+    def test_fit_case_numpy_expansion_engine(self):
+        m = DataExpansionFitter()
+        m.fit(df=self.df.drop(['C', 'T'], axis=1), expansion_engine='numpy')
+        for event in self.fitted_model.events:
+            np.testing.assert_allclose(m.event_models[event].params, self.fitted_model.event_models[event].params)
+
     def test_fit_with_kwargs(self):
         import statsmodels.api as sm
         m = DataExpansionFitter()
@@ -64,6 +64,11 @@ class TestTwoStagesFitter(unittest.TestCase):
         m = TwoStagesFitter()
         m.fit(df=self.df.drop(['C', 'T'], axis=1))
 
+    def test_fit_case_numpy_expansion_engine(self):
+        m = TwoStagesFitter()
+        m.fit(df=self.df.drop(['C', 'T'], axis=1), expansion_engine='numpy')
+        np.testing.assert_allclose(m.get_beta_SE().values, self.fitted_model.get_beta_SE().values)
+
     def test_print_summary(self):
         self.fitted_model.print_summary()
 
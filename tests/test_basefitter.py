@@ -42,4 +42,17 @@ class TestBaseFitter(unittest.TestCase):
 
     def test_expansion_predict_hazard_not_implemented(self):
         with self.assertRaises(NotImplementedError):
-            self.expansion_fitter.predict_hazard_jt(self.df, event=1, t=100)
\ No newline at end of file
+            self.expansion_fitter.predict_hazard_jt(self.df, event=1, t=100)
+
+    def test_expand_data_engines(self):
+        df = self.df.drop(['C', 'T'], axis=1)
+        pandas_df = self.expansion_fitter._expand_data(df, event_type_col='J', duration_col='X', pid_col='pid',
+                                                       engine='pandas')
+        numpy_df = self.expansion_fitter._expand_data(df, event_type_col='J', duration_col='X', pid_col='pid',
+                                                      engine='numpy')
+        self.assertTrue(pandas_df.equals(numpy_df))
+
+    def test_expand_data_case_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            self.expansion_fitter._expand_data(self.df, event_type_col='J', duration_col='X', pid_col='pid',
+                                               engine='spark')
@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 from src.pydts.data_generation import EventTimesSampler
 from src.pydts.cross_validation import TwoStagesCV, PenaltyGridSearchCV, TwoStagesCVExact, PenaltyGridSearchCVExact
+from src.pydts.expanded_data import ExpandedData
 
 
 class TestCrossValidation(unittest.TestCase):
@@ -51,6 +52,13 @@ class TestCrossValidation(unittest.TestCase):
     def test_cross_validation_bs(self):
         self.tscv.cross_validate(self.patients_df, metrics='BS')
 
+    def test_cross_validation_expanded_data(self):
+        results = self.tscv.cross_validate(self.patients_df, metrics='BS', seed=0)
+        expanded_data_tscv = TwoStagesCV()
+        expanded_data_results = expanded_data_tscv.cross_validate(
+            ExpandedData.from_df(self.patients_df.drop(['C', 'T'], axis=1)), metrics='BS', seed=0)
+        np.testing.assert_allclose(results.values, expanded_data_results.values)
+
     def test_cross_validation_auc(self):
         self.tscv.cross_validate(self.patients_df, metrics='AUC')
 
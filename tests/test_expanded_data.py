@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.pydts.examples_utils.generate_simulations_data import generate_quick_start_df
+from src.pydts.expanded_data import ExpandedData
+from src.pydts.fitters import DataExpansionFitter, TwoStagesFitter, TwoStagesFitterExact
+from src.pydts.utils import get_expanded_df, get_expanded_df_numpy
+
+
+class TestExpandedData(unittest.TestCase):
+    def setUp(self):
+        self.real_coef_dict = {
+            "alpha": {
+                1: lambda t: -1 - 0.3 * np.log(t),
+                2: lambda t: -1.75 - 0.15 * np.log(t)
+            },
+            "beta": {
+                1: -np.log([0.8, 3, 3, 2.5, 2]),
+                2: -np.log([1, 3, 4, 3, 2])
+            }
+        }
+        self.df = generate_quick_start_df(n_patients=1000, n_cov=5, d_times=10, j_events=2, pid_col='pid', seed=0,
+                                          real_coef_dict=self.real_coef_dict,
+                                          censoring_prob=0.8).drop(['C', 'T'], axis=1)
+        self.expanded_data = ExpandedData.from_df(self.df)
+
+    def test_from_df_types(self):
+        self.assertEqual(self.expanded_data.times.dtype, np.int16)
+        self.assertEqual(self.expanded_data.event_indicators.dtype, np.int8)
+        self.assertTrue(self.expanded_data.covariates_values.flags['F_CONTIGUOUS'])
+        self.assertEqual(len(self.expanded_data.offsets), self.expanded_data.n_samples + 1)
+
+    def test_to_df_same_as_get_expanded_df(self):
+        pd.testing.assert_frame_equal(get_expanded_df(self.df), self.expanded_data.to_df())
+
+    def test_from_expanded_df(self):
+        expanded_data = ExpandedData.from_expanded_df(get_expanded_df(self.df))
+        pd.testing.assert_frame_equal(self.expanded_data.to_df(), expanded_data.to_df())
+
+    def test_get_samples_df(self):
+        pd.testing.assert_frame_equal(self.df, self.expanded_data.get_samples_df())
+
+    def test_take(self):
+        samples_idx = np.random.RandomState(0).permutation(len(self.df))[:10]
+        pd.testing.assert_frame_equal(
+            get_expanded_df_numpy(self.df.iloc[samples_idx].reset_index(drop=True)),
+            self.expanded_data.take(samples_idx).to_df())
+
+    def test_select(self):
+        selected = self.expanded_data.select(['Z2', 'Z3'])
+        self.assertEqual(selected.columns, ['pid', 'Z2', 'Z3', 'J', 'X', 'j_0', 'j_1', 'j_2'])
+        self.assertTrue(np.shares_memory(selected.covariates_values, self.expanded_data.covariates_values))
+
+    def test_select_case_missing_covariate(self):
+        with self.assertRaises(ValueError):
+            self.expanded_data.select(['Z6'])
+
+    def test_nbytes_smaller_than_expanded_df(self):
+        self.assertLess(self.expanded_data.nbytes, get_expanded_df(self.df).memory_usage(deep=True).sum() / 1.5)
+
+    def test_data_expansion_fitter(self):
+        fitter = DataExpansionFitter()
+        fitter.fit(df=self.df)
+        expanded_data_fitter = DataExpansionFitter()
+        expanded_data_fitter.fit(df=self.expanded_data)
+        for event in fitter.events:
+            np.testing.assert_allclose(fitter.event_models[event].params,
+                                       expanded_data_fitter.event_models[event].params)
+
+    def test_two_stages_fitter(self):
+        fitter = TwoStagesFitter()
+        fitter.fit(df=self.df)
+        expanded_data_fitter = TwoStagesFitter()
+        expanded_data_fitter.fit(df=self.expanded_data)
+        np.testing.assert_allclose(fitter.get_beta_SE().values, expanded_data_fitter.get_beta_SE().values)
+        np.testing.assert_allclose(fitter.alpha_df['alpha_jt'].values,
+                                   expanded_data_fitter.alpha_df['alpha_jt'].values)
+
+    def test_two_stages_fitter_exact(self):
+        df = generate_quick_start_df(n_patients=300, n_cov=5, d_times=4, j_events=2, pid_col='pid', seed=0,
+                                     real_coef_dict=self.real_coef_dict, censoring_prob=0.1).drop(['C', 'T'], axis=1)
+        fitter = TwoStagesFitterExact()
+        fitter.fit(df=df, covariates={1: ['Z1', 'Z2'], 2: ['Z3']})
+        expanded_data_fitter = TwoStagesFitterExact()
+        expanded_data_fitter.fit(df=ExpandedData.from_df(df), covariates={1: ['Z1', 'Z2'], 2: ['Z3']})
+        for event in fitter.events:
+            np.testing.assert_allclose(fitter.beta_models[event].params.values,
+                                       expanded_data_fitter.beta_models[event].params.values)
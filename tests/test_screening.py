@@ -59,6 +59,12 @@ class TestScreening(unittest.TestCase):
         expanded_df = get_expanded_df(self.patients_df.drop(['C', 'T'], axis=1))
         self.fitter.fit_marginal_model(expanded_df, covariate='Z1')
 
+    def test_psis_fit_marginal_model_expanded_data(self):
+        df = self.patients_df.drop(['C', 'T'], axis=1)
+        res = self.fitter.fit_marginal_model(get_expanded_df(df), covariate='Z1')
+        expanded_data_res = self.fitter.fit_marginal_model(ExpandedData.from_df(df), covariate='Z1')
+        np.testing.assert_allclose(res.astype(float).values, expanded_data_res.astype(float).values)
+
     def test_psis_get_marginal_estimates(self):
         expanded_df = get_expanded_df(self.patients_df.drop(['C', 'T'], axis=1))
         self.fitter.get_marginal_estimates(expanded_df)
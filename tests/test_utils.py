@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.pydts.examples_utils.generate_simulations_data import generate_quick_start_df
+from src.pydts.utils import get_expanded_df, get_expanded_df_numpy
+
+
+class TestUtils(unittest.TestCase):
+    def setUp(self):
+        self.real_coef_dict = {
+            "alpha": {
+                1: lambda t: -1 - 0.3 * np.log(t),
+                2: lambda t: -1.75 - 0.15 * np.log(t)
+            },
+            "beta": {
+                1: -np.log([0.8, 3, 3, 2.5, 2]),
+                2: -np.log([1, 3, 4, 3, 2])
+            }
+        }
+        self.df = generate_quick_start_df(n_patients=1000, n_cov=5, d_times=10, j_events=2, pid_col='pid', seed=0,
+                                          real_coef_dict=self.real_coef_dict, censoring_prob=0.8)
+
+    def test_get_expanded_df_numpy_same_as_get_expanded_df(self):
+        df = self.df.drop(['C', 'T'], axis=1)
+        pd.testing.assert_frame_equal(get_expanded_df(df), get_expanded_df_numpy(df))
+
+    def test_get_expanded_df_numpy_case_no_censoring(self):
+        df = self.df[self.df['J'] > 0].drop(['C', 'T'], axis=1).reset_index(drop=True)
+        expanded_df = get_expanded_df_numpy(df)
+        pd.testing.assert_frame_equal(get_expanded_df(df), expanded_df)
+        self.assertEqual(expanded_df.columns[-1], 'j_0')
+
+    def test_get_expanded_df_numpy_case_non_default_index(self):
+        df = self.df.drop(['C', 'T'], axis=1)
+        df.index = df.index * 2 + 7
+        pd.testing.assert_frame_equal(get_expanded_df(df), get_expanded_df_numpy(df))